@@ -6,8 +6,9 @@ Layers include: Payment System Type, Operator, Bank Participation, Status, and m
 
 import json
 import csv
+import sys
 from typing import Dict, List, Tuple
-from collections import defaultdict
+from operator import itemgetter
 
 # Country name mappings to handle variations
 COUNTRY_MAPPINGS = {
@@ -20,193 +21,236 @@ COUNTRY_MAPPINGS = {
     'Russia': 'Russian Federation',
 }
 
+# Regional (non-country) entries and blanks to skip when loading
+SKIPPED_REGIONS = frozenset(('', 'Africa', 'Asia', 'Europe'))
+
+# Output key -> (CSV column, default when the column is missing) for each stored payment system
+SYSTEM_FIELDS = [
+    ('name', 'Payment system name', 'Unknown'),
+    ('payment_type', 'Payment system type', 'NA'),
+    ('operator', 'Operator', 'NA'),
+    ('bank_participation', 'Bank participation', 'NA'),
+    ('nonbank_participation', 'Non-bank participation', 'NA'),
+    ('status', 'Status of payment system implementation', 'NA'),
+    ('national_regional', 'National / Regional', 'National'),
+    ('settlement_type', 'Type of settlement system', 'NA'),
+    ('qr_code', 'QR code based transactions', 'NA'),
+    ('cross_border', 'Cross-border payments', 'NA'),
+    ('transactions_supported', 'Types of transactions supported', 'NA'),
+    ('active', 'Active real-time payment system present', 'No'),
+    ('url', 'URL', ''),
+]
+
+# Columns the real-time/implemented filter reads
+FILTER_COLUMNS = [
+    'Active real-time payment system present',
+    'Status of payment system implementation',
+]
+
+def build_system_converter(header: List[str]):
+    """Build a function mapping a full-width CSV row to a system info dict for the given header."""
+    keys = tuple(key for key, _, _ in SYSTEM_FIELDS)
+    positions = {column: i for i, column in enumerate(header)}
+    # Missing columns read their default from a tail appended to each row
+    fallback = []
+    indices = []
+    for _, column, default in SYSTEM_FIELDS:
+        if column in positions:
+            indices.append(positions[column])
+        else:
+            indices.append(len(header) + len(fallback))
+            fallback.append(default)
+
+    pick = itemgetter(*indices)
+    if not fallback:
+        return lambda row: dict(zip(keys, pick(row)))
+    return lambda row: dict(zip(keys, pick(row + fallback)))
+
 def normalize_country_name(name: str) -> str:
     """Normalize country names for matching."""
     name = name.strip()
-    return COUNTRY_MAPPINGS.get(name, name)
+    return sys.intern(COUNTRY_MAPPINGS.get(name, name))
 
 def load_payment_data(csv_file: str, filter_realtime_implemented: bool = False) -> Dict[str, List[Dict]]:
     """Load payment system data from CSV and group by country."""
-    payment_by_country = defaultdict(list)
+    payment_by_country = {}
+
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return payment_by_country  # Empty file
+        required = ['Country / Region'] + (FILTER_COLUMNS if filter_realtime_implemented else [])
+        missing = [column for column in required if column not in header]
+        if missing:
+            raise ValueError(f"{csv_file} is missing required column(s): {', '.join(missing)}")
+
+        # Resolve column positions once instead of building a dict per row
+        country_col = header.index('Country / Region')
+        if filter_realtime_implemented:
+            active_col = header.index('Active real-time payment system present')
+            status_col = header.index('Status of payment system implementation')
+        to_system = build_system_converter(header)
+        normalize = normalize_country_name
+        width = len(header)
 
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
         for row in reader:
-            country = normalize_country_name(row.get('Country / Region', ''))
-            if not country or country in ['Africa', 'Asia', 'Europe']:
+            if not row:
+                continue  # Skip blank lines
+            if len(row) != width:
+                # Pad rows with trailing columns left off, drop extra fields
+                row = (row + [''] * width)[:width]
+
+            country = normalize(row[country_col])
+            if country in SKIPPED_REGIONS:
                 continue  # Skip regional entries
 
             # Apply filters if requested
             if filter_realtime_implemented:
-                active_realtime = row.get('Active real-time payment system present', 'No')
-                status = row.get('Status of payment system implementation', 'NA')
-                if active_realtime != 'Yes' or status != 'Implemented':
+                if row[active_col] != 'Yes' or row[status_col] != 'Implemented':
                     continue  # Skip non-real-time or non-implemented systems
 
             # Store all payment system info
-            system_info = {
-                'name': row.get('Payment system name', 'Unknown'),
-                'payment_type': row.get('Payment system type', 'NA'),
-                'operator': row.get('Operator', 'NA'),
-                'bank_participation': row.get('Bank participation', 'NA'),
-                'nonbank_participation': row.get('Non-bank participation', 'NA'),
-                'status': row.get('Status of payment system implementation', 'NA'),
-                'national_regional': row.get('National / Regional', 'National'),
-                'settlement_type': row.get('Type of settlement system', 'NA'),
-                'qr_code': row.get('QR code based transactions', 'NA'),
-                'cross_border': row.get('Cross-border payments', 'NA'),
-                'transactions_supported': row.get('Types of transactions supported', 'NA'),
-                'active': row.get('Active real-time payment system present', 'No'),
-                'url': row.get('URL', ''),
-            }
+            system_info = to_system(row)
+
+            systems = payment_by_country.get(country)
+            if systems is None:
+                payment_by_country[country] = [system_info]
+            else:
+                systems.append(system_info)
+
+    return payment_by_country
+
+# Marker colors per layer value
+DEFAULT_COLOR = '#757575'
+
+PAYMENT_TYPE_COLORS = {
+    'Interbank payment system': '#2E7D32',  # Dark green
+    'Cross-domain payment system': '#1976D2',  # Blue
+    'Mobile money': '#F57C00',  # Orange
+    'CBDC': '#7B1FA2',  # Purple
+    'Mobile wallet': '#C2185B',  # Pink
+    'Interbank payment system, Mobile wallet': '#00796B',  # Teal
+    'NA': '#9E9E9E',  # Gray
+}
 
-            payment_by_country[country].append(system_info)
+OPERATOR_COLORS = {
+    'Central bank': '#1565C0',  # Dark blue
+    'Bank association': '#00897B',  # Teal
+    'Commercial bank/Private PSP': '#6A1B9A',  # Purple
+    'Private PSP': '#AD1457',  # Pink
+    'Central bank/Bank association': '#0277BD',  # Light blue
+    'Other': '#F57C00',  # Orange
+    'NA': '#9E9E9E',  # Gray
+}
 
-    return dict(payment_by_country)
+STATUS_COLORS = {
+    'Implemented': '#2E7D32',  # Dark green
+    'Planned/Piloted': '#F9A825',  # Amber
+    'NA': '#9E9E9E',  # Gray
+}
 
-def get_color_for_payment_type(payment_type: str) -> str:
-    """Get color for payment system type."""
-    colors = {
-        'Interbank payment system': '#2E7D32',  # Dark green
-        'Cross-domain payment system': '#1976D2',  # Blue
-        'Mobile money': '#F57C00',  # Orange
-        'CBDC': '#7B1FA2',  # Purple
-        'Mobile wallet': '#C2185B',  # Pink
-        'Interbank payment system, Mobile wallet': '#00796B',  # Teal
-        'NA': '#9E9E9E',  # Gray
-    }
-    return colors.get(payment_type, '#757575')
-
-def get_color_for_operator(operator: str) -> str:
-    """Get color for operator type."""
-    colors = {
-        'Central bank': '#1565C0',  # Dark blue
-        'Bank association': '#00897B',  # Teal
-        'Commercial bank/Private PSP': '#6A1B9A',  # Purple
-        'Private PSP': '#AD1457',  # Pink
-        'Central bank/Bank association': '#0277BD',  # Light blue
-        'Other': '#F57C00',  # Orange
-        'NA': '#9E9E9E',  # Gray
-    }
-    return colors.get(operator.strip(), '#757575')
-
-def get_color_for_status(status: str) -> str:
-    """Get color for implementation status."""
-    colors = {
-        'Implemented': '#2E7D32',  # Dark green
-        'Planned/Piloted': '#F9A825',  # Amber
-        'NA': '#9E9E9E',  # Gray
-    }
-    return colors.get(status, '#757575')
-
-def get_color_for_yes_no(value: str) -> str:
-    """Get color for yes/no fields."""
-    colors = {
-        'Yes': '#2E7D32',  # Green
-        'No': '#D32F2F',  # Red
-        'NA': '#9E9E9E',  # Gray
-    }
-    return colors.get(value, '#757575')
-
-def get_color_for_settlement(settlement: str) -> str:
-    """Get color for settlement type."""
-    colors = {
-        'RTGS': '#1565C0',  # Dark blue
-        'DNS': '#00897B',  # Teal
-        'ACH': '#6A1B9A',  # Purple
-        'MN': '#F57C00',  # Orange
-        'Distributed settlement': '#00796B',  # Teal
-        'NA': '#9E9E9E',  # Gray
-    }
-    # Handle combined types by taking the first one
-    settlement_clean = settlement.split(',')[0].strip() if settlement else 'NA'
-    return colors.get(settlement_clean, '#757575')
-
-def get_color_for_national_regional(nr: str) -> str:
-    """Get color for national/regional."""
-    colors = {
-        'National': '#1976D2',  # Blue
-        'Regional': '#388E3C',  # Green
-    }
-    return colors.get(nr, '#757575')
+YES_NO_COLORS = {
+    'Yes': '#2E7D32',  # Green
+    'No': '#D32F2F',  # Red
+    'NA': '#9E9E9E',  # Gray
+}
+
+SETTLEMENT_COLORS = {
+    'RTGS': '#1565C0',  # Dark blue
+    'DNS': '#00897B',  # Teal
+    'ACH': '#6A1B9A',  # Purple
+    'MN': '#F57C00',  # Orange
+    'Distributed settlement': '#00796B',  # Teal
+    'NA': '#9E9E9E',  # Gray
+}
+
+NATIONAL_REGIONAL_COLORS = {
+    'National': '#1976D2',  # Blue
+    'Regional': '#388E3C',  # Green
+}
+
+def primary_settlement_type(settlement: str) -> str:
+    """Reduce combined settlement types to the first one listed."""
+    return settlement.split(',')[0].strip() if settlement else 'NA'
+
+# Layer type -> (system field, color table, value normalizer or None)
+LAYER_SPEC = {
+    'payment_type': ('payment_type', PAYMENT_TYPE_COLORS, None),
+    'operator': ('operator', OPERATOR_COLORS, str.strip),
+    'bank_participation': ('bank_participation', YES_NO_COLORS, None),
+    'nonbank_participation': ('nonbank_participation', YES_NO_COLORS, None),
+    'status': ('status', STATUS_COLORS, None),
+    'settlement_type': ('settlement_type', SETTLEMENT_COLORS, primary_settlement_type),
+    'national_regional': ('national_regional', NATIONAL_REGIONAL_COLORS, None),
+    'qr_code': ('qr_code', YES_NO_COLORS, None),
+}
+
+# Layers in the order they are offered on the map
+LAYER_TYPES = [
+    'payment_type',
+    'operator',
+    'status',
+    'bank_participation',
+    'nonbank_participation',
+    'settlement_type',
+    'national_regional',
+    'qr_code'
+]
+
+POPUP_SYSTEM_TEMPLATE = (
+    "<b>{number}. {name}</b><br/>"
+    "Type: {payment_type}<br/>"
+    "Operator: {operator}<br/>"
+    "Status: {status}<br/>"
+)
 
 def build_popup_html(country: str, systems: List[Dict]) -> str:
     """Build popup HTML for a country."""
-    html = f"<b>{country}</b><br/><br/>"
-    html += f"<b>Payment Systems: {len(systems)}</b><br/><br/>"
-
-    for i, sys in enumerate(systems[:5]):  # Limit to 5 systems
-        html += f"<b>{i+1}. {sys['name']}</b><br/>"
-        html += f"Type: {sys['payment_type']}<br/>"
-        html += f"Operator: {sys['operator']}<br/>"
-        html += f"Status: {sys['status']}<br/>"
-        if sys['active'] == 'Yes':
-            html += f"✓ Active real-time system<br/>"
-        html += "<br/>"
+    parts = [f"<b>{country}</b><br/><br/>", f"<b>Payment Systems: {len(systems)}</b><br/><br/>"]
+
+    for i, system in enumerate(systems[:5]):  # Limit to 5 systems
+        parts.append(POPUP_SYSTEM_TEMPLATE.format(number=i + 1, **system))
+        if system['active'] == 'Yes':
+            parts.append("✓ Active real-time system<br/>")
+        parts.append("<br/>")
 
     if len(systems) > 5:
-        html += f"<i>...and {len(systems) - 5} more systems</i><br/>"
+        parts.append(f"<i>...and {len(systems) - 5} more systems</i><br/>")
 
-    return html
+    return ''.join(parts)
 
-def generate_layer_markers(payment_data: Dict[str, List[Dict]], layer_type: str) -> List[Dict]:
-    """Generate markers for a specific layer."""
-    markers = []
+def build_all_layers(payment_data: Dict[str, List[Dict]]) -> Tuple[Dict[str, Dict], Dict[str, Dict[str, Dict]]]:
+    """Build per-country popup state and the markers of every layer in one pass."""
+    country_state = {}
+    layers = {layer_type: {} for layer_type in LAYER_TYPES}
+    layer_specs = [(layers[layer_type],) + LAYER_SPEC[layer_type] for layer_type in LAYER_TYPES]
 
     for country, systems in payment_data.items():
         # Get the most relevant system for this country
         # For countries with multiple systems, prioritize active/implemented ones
-        active_systems = [s for s in systems if s['active'] == 'Yes']
-        implemented_systems = [s for s in systems if s['status'] == 'Implemented']
-
-        primary_system = None
-        if active_systems:
-            primary_system = active_systems[0]
-        elif implemented_systems:
-            primary_system = implemented_systems[0]
-        else:
-            primary_system = systems[0]
-
-        # Determine color based on layer type
-        if layer_type == 'payment_type':
-            color = get_color_for_payment_type(primary_system['payment_type'])
-            value = primary_system['payment_type']
-        elif layer_type == 'operator':
-            color = get_color_for_operator(primary_system['operator'])
-            value = primary_system['operator']
-        elif layer_type == 'bank_participation':
-            color = get_color_for_yes_no(primary_system['bank_participation'])
-            value = primary_system['bank_participation']
-        elif layer_type == 'nonbank_participation':
-            color = get_color_for_yes_no(primary_system['nonbank_participation'])
-            value = primary_system['nonbank_participation']
-        elif layer_type == 'status':
-            color = get_color_for_status(primary_system['status'])
-            value = primary_system['status']
-        elif layer_type == 'settlement_type':
-            color = get_color_for_settlement(primary_system['settlement_type'])
-            value = primary_system['settlement_type'].split(',')[0].strip() if primary_system['settlement_type'] else 'NA'
-        elif layer_type == 'national_regional':
-            color = get_color_for_national_regional(primary_system['national_regional'])
-            value = primary_system['national_regional']
-        elif layer_type == 'qr_code':
-            color = get_color_for_yes_no(primary_system['qr_code'])
-            value = primary_system['qr_code']
-        else:
-            color = '#757575'
-            value = 'Unknown'
-
-        popup = build_popup_html(country, systems)
+        primary_system = (
+            next((s for s in systems if s['active'] == 'Yes'), None)
+            or next((s for s in systems if s['status'] == 'Implemented'), systems[0])
+        )
+
+        # Popups are shared by all layers, so they are kept once per country
+        country_state[country] = {
+            'popup': build_popup_html(country, systems),
+            'system_count': len(systems),
+        }
 
-        markers.append({
-            'country': country,
-            'color': color,
-            'value': value,
-            'popup': popup,
-            'system_count': len(systems)
-        })
+        # Determine color for each layer type
+        for markers, field, colors, normalize in layer_specs:
+            value = primary_system[field]
+            if normalize:
+                value = normalize(value)
+            markers[country] = {
+                'color': colors.get(value, DEFAULT_COLOR),
+                'value': value,
+            }
 
-    return markers
+    return country_state, layers
 
 def get_legend_items(layer_type: str) -> Tuple[str, List[Tuple[str, str]]]:
     """Get legend title and items for a layer type."""
@@ -260,30 +304,12 @@ def get_legend_items(layer_type: str) -> Tuple[str, List[Tuple[str, str]]]:
     }
     return legends.get(layer_type, ('Unknown', []))
 
-def generate_html_map(payment_data: Dict[str, List[Dict]], output_file: str):
-    """Generate interactive HTML map with multiple layers."""
+LEGENDS_JSON = json.dumps(
+    {lt: get_legend_items(lt) for lt in LAYER_TYPES}, separators=(',', ':'), ensure_ascii=False
+)
 
-    # Generate markers for each layer type
-    layer_types = [
-        'payment_type',
-        'operator',
-        'status',
-        'bank_participation',
-        'nonbank_participation',
-        'settlement_type',
-        'national_regional',
-        'qr_code'
-    ]
-
-    layers_data = {}
-    for layer_type in layer_types:
-        layers_data[layer_type] = generate_layer_markers(payment_data, layer_type)
-
-    # Get country coordinates
-    country_coords = get_country_coordinates()
-
-    # Generate HTML
-    html_content = '''<!DOCTYPE html>
+# Page template, split around the JSON payloads written by generate_html_map
+HTML_HEAD = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -402,13 +428,24 @@ def generate_html_map(payment_data: Dict[str, List[Dict]], output_file: str):
         }).addTo(map);
 
         // Country coordinates
-        var countryCoords = ''' + json.dumps(country_coords) + ''';
+        var countryCoords = '''
+
+HTML_BEFORE_COUNTRY_STATE = ''';
+
+        // Country popups and system counts
+        var countryState = '''
+
+HTML_BEFORE_LAYERS = ''';
 
         // Layer data
-        var layersData = ''' + json.dumps(layers_data) + ''';
+        var layersData = '''
+
+HTML_BEFORE_LEGENDS = ''';
 
         // Layer legends
-        var layerLegends = ''' + json.dumps({lt: get_legend_items(lt) for lt in layer_types}) + ''';
+        var layerLegends = '''
+
+HTML_TAIL = ''';
 
         // Current layer
         var currentLayer = 'payment_type';
@@ -419,18 +456,20 @@ def generate_html_map(payment_data: Dict[str, List[Dict]], output_file: str):
             currentMarkers.clearLayers();
 
             var markers = layersData[currentLayer];
-            markers.forEach(function(marker) {
-                var coords = countryCoords[marker.country];
+            Object.keys(markers).forEach(function(country) {
+                var marker = markers[country];
+                var state = countryState[country];
+                var coords = countryCoords[country];
                 if (coords) {
                     var circle = L.circleMarker([coords[0], coords[1]], {
-                        radius: 6 + (marker.system_count > 1 ? 2 : 0),
+                        radius: 6 + (state.system_count > 1 ? 2 : 0),
                         fillColor: marker.color,
                         color: '#000',
                         weight: 1,
                         opacity: 1,
                         fillOpacity: 0.8
                     });
-                    circle.bindPopup(marker.popup);
+                    circle.bindPopup(state.popup);
                     currentMarkers.addLayer(circle);
                 }
             });
@@ -528,212 +567,229 @@ def generate_html_map(payment_data: Dict[str, List[Dict]], output_file: str):
 </body>
 </html>'''
 
+def generate_html_map(payment_data: Dict[str, List[Dict]], output_file: str):
+    """Generate interactive HTML map with multiple layers."""
+
+    # Generate popups and markers for each layer type
+    country_state, layers_data = build_all_layers(payment_data)
+
+    # Write the page in chunks, serializing each JSON payload between template chunks
+    # Coordinates and legends are fixed, so they are spliced in pre-serialized
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(HTML_HEAD)
+        f.write(COUNTRY_COORDS_JSON)
+        f.write(HTML_BEFORE_COUNTRY_STATE)
+        f.write(json.dumps(country_state, separators=(',', ':'), ensure_ascii=False))
+        f.write(HTML_BEFORE_LAYERS)
+        f.write(json.dumps(layers_data, separators=(',', ':'), ensure_ascii=False))
+        f.write(HTML_BEFORE_LEGENDS)
+        f.write(LEGENDS_JSON)
+        f.write(HTML_TAIL)
 
     print(f"Map generated successfully: {output_file}")
     print(f"Total countries mapped: {len(payment_data)}")
     print(f"Total payment systems: {sum(len(systems) for systems in payment_data.values())}")
 
-def get_country_coordinates() -> Dict[str, List[float]]:
-    """Return approximate country coordinates (lat, lon)."""
-    return {
-        # Major countries - approximate centroids
-        "Afghanistan": [33.0, 65.0],
-        "Albania": [41.0, 20.0],
-        "Algeria": [28.0, 3.0],
-        "Andorra": [42.5, 1.5],
-        "Angola": [-12.5, 18.5],
-        "Antigua and Barbuda": [17.05, -61.8],
-        "Argentina": [-34.0, -64.0],
-        "Armenia": [40.0, 45.0],
-        "Australia": [-25.0, 135.0],
-        "Austria": [47.5, 14.5],
-        "Azerbaijan": [40.5, 47.5],
-        "Bahamas": [24.25, -76.0],
-        "Bahrain": [26.0, 50.5],
-        "Bangladesh": [24.0, 90.0],
-        "Barbados": [13.2, -59.5],
-        "Belarus": [53.0, 28.0],
-        "Belgium": [50.8, 4.0],
-        "Belize": [17.25, -88.75],
-        "Benin": [9.5, 2.25],
-        "Bhutan": [27.5, 90.5],
-        "Bolivia": [-17.0, -65.0],
-        "Bosnia and Herzegovina": [44.0, 18.0],
-        "Botswana": [-22.0, 24.0],
-        "Brazil": [-10.0, -55.0],
-        "Brunei": [4.5, 114.67],
-        "Bulgaria": [43.0, 25.0],
-        "Burkina Faso": [13.0, -2.0],
-        "Burundi": [-3.5, 30.0],
-        "Cabo Verde": [16.0, -24.0],
-        "Cambodia": [13.0, 105.0],
-        "Cameroon": [6.0, 12.0],
-        "Canada": [60.0, -95.0],
-        "Central African Republic": [7.0, 21.0],
-        "Chad": [15.0, 19.0],
-        "Chile": [-30.0, -71.0],
-        "China": [35.0, 105.0],
-        "Colombia": [4.0, -72.0],
-        "Comoros": [-12.17, 44.25],
-        "Congo": [-1.0, 15.0],
-        "Costa Rica": [10.0, -84.0],
-        "Croatia": [45.1, 15.2],
-        "Cuba": [21.5, -80.0],
-        "Cyprus": [35.0, 33.0],
-        "Czechia": [49.75, 15.5],
-        "Denmark": [56.0, 10.0],
-        "Djibouti": [11.5, 43.0],
-        "Dominica": [15.42, -61.33],
-        "Dominican Republic": [19.0, -70.5],
-        "Ecuador": [-2.0, -77.5],
-        "Egypt": [27.0, 30.0],
-        "El Salvador": [13.8, -88.9],
-        "Equatorial Guinea": [2.0, 10.0],
-        "Estonia": [59.0, 26.0],
-        "Eswatini": [-26.5, 31.5],
-        "Ethiopia": [8.0, 38.0],
-        "Fiji": [-18.0, 175.0],
-        "Finland": [64.0, 26.0],
-        "France": [46.0, 2.0],
-        "Gabon": [-1.0, 11.75],
-        "Gambia": [13.5, -15.5],
-        "Georgia": [42.0, 43.5],
-        "Germany": [51.0, 9.0],
-        "Ghana": [8.0, -2.0],
-        "Greece": [39.0, 22.0],
-        "Grenada": [12.12, -61.67],
-        "Guatemala": [15.5, -90.25],
-        "Guinea": [11.0, -10.0],
-        "Guinea-Bissau": [12.0, -15.0],
-        "Guyana": [5.0, -59.0],
-        "Haiti": [19.0, -72.42],
-        "Honduras": [15.0, -86.5],
-        "Hong Kong": [22.3, 114.2],
-        "Hungary": [47.0, 20.0],
-        "Iceland": [65.0, -18.0],
-        "India": [20.0, 77.0],
-        "Indonesia": [-5.0, 120.0],
-        "Iran": [32.0, 53.0],
-        "Iraq": [33.0, 44.0],
-        "Ireland": [53.0, -8.0],
-        "Israel": [31.5, 34.75],
-        "Italy": [42.8, 12.8],
-        "Jamaica": [18.25, -77.5],
-        "Japan": [36.0, 138.0],
-        "Jordan": [31.0, 36.0],
-        "Kazakhstan": [48.0, 68.0],
-        "Kenya": [1.0, 38.0],
-        "Kiribati": [1.42, 173.0],
-        "Kosovo": [42.67, 21.17],
-        "Kuwait": [29.5, 45.75],
-        "Kyrgyzstan": [41.0, 75.0],
-        "Laos": [18.0, 105.0],
-        "Latvia": [57.0, 25.0],
-        "Lebanon": [33.8, 35.8],
-        "Lesotho": [-29.5, 28.5],
-        "Liberia": [6.5, -9.5],
-        "Libya": [25.0, 17.0],
-        "Liechtenstein": [47.17, 9.53],
-        "Lithuania": [56.0, 24.0],
-        "Luxembourg": [49.75, 6.17],
-        "Macao": [22.17, 113.55],
-        "Madagascar": [-20.0, 47.0],
-        "Malawi": [-13.5, 34.0],
-        "Malaysia": [2.5, 112.5],
-        "Maldives": [3.25, 73.0],
-        "Mali": [17.0, -4.0],
-        "Malta": [35.9, 14.4],
-        "Marshall Islands": [9.0, 168.0],
-        "Mauritania": [20.0, -12.0],
-        "Mauritius": [-20.3, 57.6],
-        "Mexico": [23.0, -102.0],
-        "Micronesia": [6.92, 158.25],
-        "Moldova": [47.0, 29.0],
-        "Monaco": [43.73, 7.42],
-        "Mongolia": [46.0, 105.0],
-        "Montenegro": [42.5, 19.3],
-        "Morocco": [32.0, -5.0],
-        "Mozambique": [-18.25, 35.0],
-        "Myanmar": [22.0, 98.0],
-        "Namibia": [-22.0, 17.0],
-        "Nauru": [-0.53, 166.92],
-        "Nepal": [28.0, 84.0],
-        "Netherlands": [52.5, 5.75],
-        "New Zealand": [-41.0, 174.0],
-        "Nicaragua": [13.0, -85.0],
-        "Niger": [16.0, 8.0],
-        "Nigeria": [10.0, 8.0],
-        "North Macedonia": [41.83, 22.0],
-        "Norway": [62.0, 10.0],
-        "Oman": [21.0, 57.0],
-        "Pakistan": [30.0, 70.0],
-        "Palau": [7.5, 134.5],
-        "Palestine": [32.0, 35.25],
-        "Panama": [9.0, -80.0],
-        "Papua New Guinea": [-6.0, 147.0],
-        "Paraguay": [-23.0, -58.0],
-        "Peru": [-10.0, -76.0],
-        "Philippines": [13.0, 122.0],
-        "Poland": [52.0, 20.0],
-        "Portugal": [39.5, -8.0],
-        "Qatar": [25.5, 51.25],
-        "Republic of Korea": [37.0, 127.5],
-        "Romania": [46.0, 25.0],
-        "Russian Federation": [60.0, 100.0],
-        "Rwanda": [-2.0, 30.0],
-        "Saint Kitts and Nevis": [17.33, -62.75],
-        "Saint Lucia": [14.0, -61.0],
-        "Saint Vincent and the Grenadines": [13.25, -61.2],
-        "Samoa": [-13.58, -172.33],
-        "San Marino": [43.77, 12.42],
-        "Sao Tome and Principe": [1.0, 7.0],
-        "Saudi Arabia": [25.0, 45.0],
-        "Senegal": [14.0, -14.0],
-        "Serbia": [44.0, 21.0],
-        "Seychelles": [-4.58, 55.67],
-        "Sierra Leone": [8.5, -11.5],
-        "Singapore": [1.3, 103.8],
-        "Slovakia": [48.7, 19.5],
-        "Slovenia": [46.1, 14.8],
-        "Solomon Islands": [-8.0, 159.0],
-        "Somalia": [10.0, 49.0],
-        "South Africa": [-29.0, 24.0],
-        "South Sudan": [7.0, 30.0],
-        "Spain": [40.0, -4.0],
-        "Sri Lanka": [7.0, 81.0],
-        "Sudan": [15.0, 30.0],
-        "Suriname": [4.0, -56.0],
-        "Sweden": [62.0, 15.0],
-        "Switzerland": [47.0, 8.0],
-        "Syria": [35.0, 38.0],
-        "Taiwan": [23.5, 121.0],
-        "Tajikistan": [39.0, 71.0],
-        "Tanzania": [-6.0, 35.0],
-        "Thailand": [15.0, 100.0],
-        "Timor-Leste": [-8.83, 125.92],
-        "Togo": [8.0, 1.17],
-        "Tonga": [-20.0, -175.0],
-        "Trinidad and Tobago": [11.0, -61.0],
-        "Tunisia": [34.0, 9.0],
-        "Turkey": [39.0, 35.0],
-        "Turkmenistan": [40.0, 60.0],
-        "Tuvalu": [-8.0, 178.0],
-        "Uganda": [1.0, 32.0],
-        "Ukraine": [49.0, 32.0],
-        "United Arab Emirates": [24.0, 54.0],
-        "United Kingdom": [54.0, -2.0],
-        "United States of America": [38.0, -97.0],
-        "Uruguay": [-33.0, -56.0],
-        "Uzbekistan": [41.0, 64.0],
-        "Vanuatu": [-16.0, 167.0],
-        "Venezuela": [8.0, -66.0],
-        "Vietnam": [16.0, 106.0],
-        "Yemen": [15.0, 48.0],
-        "Zambia": [-15.0, 30.0],
-        "Zimbabwe": [-20.0, 30.0],
-    }
+# Approximate country coordinates (lat, lon)
+COUNTRY_COORDS = {
+    # Major countries - approximate centroids
+    "Afghanistan": [33.0, 65.0],
+    "Albania": [41.0, 20.0],
+    "Algeria": [28.0, 3.0],
+    "Andorra": [42.5, 1.5],
+    "Angola": [-12.5, 18.5],
+    "Antigua and Barbuda": [17.05, -61.8],
+    "Argentina": [-34.0, -64.0],
+    "Armenia": [40.0, 45.0],
+    "Australia": [-25.0, 135.0],
+    "Austria": [47.5, 14.5],
+    "Azerbaijan": [40.5, 47.5],
+    "Bahamas": [24.25, -76.0],
+    "Bahrain": [26.0, 50.5],
+    "Bangladesh": [24.0, 90.0],
+    "Barbados": [13.2, -59.5],
+    "Belarus": [53.0, 28.0],
+    "Belgium": [50.8, 4.0],
+    "Belize": [17.25, -88.75],
+    "Benin": [9.5, 2.25],
+    "Bhutan": [27.5, 90.5],
+    "Bolivia": [-17.0, -65.0],
+    "Bosnia and Herzegovina": [44.0, 18.0],
+    "Botswana": [-22.0, 24.0],
+    "Brazil": [-10.0, -55.0],
+    "Brunei": [4.5, 114.67],
+    "Bulgaria": [43.0, 25.0],
+    "Burkina Faso": [13.0, -2.0],
+    "Burundi": [-3.5, 30.0],
+    "Cabo Verde": [16.0, -24.0],
+    "Cambodia": [13.0, 105.0],
+    "Cameroon": [6.0, 12.0],
+    "Canada": [60.0, -95.0],
+    "Central African Republic": [7.0, 21.0],
+    "Chad": [15.0, 19.0],
+    "Chile": [-30.0, -71.0],
+    "China": [35.0, 105.0],
+    "Colombia": [4.0, -72.0],
+    "Comoros": [-12.17, 44.25],
+    "Congo": [-1.0, 15.0],
+    "Costa Rica": [10.0, -84.0],
+    "Croatia": [45.1, 15.2],
+    "Cuba": [21.5, -80.0],
+    "Cyprus": [35.0, 33.0],
+    "Czechia": [49.75, 15.5],
+    "Denmark": [56.0, 10.0],
+    "Djibouti": [11.5, 43.0],
+    "Dominica": [15.42, -61.33],
+    "Dominican Republic": [19.0, -70.5],
+    "Ecuador": [-2.0, -77.5],
+    "Egypt": [27.0, 30.0],
+    "El Salvador": [13.8, -88.9],
+    "Equatorial Guinea": [2.0, 10.0],
+    "Estonia": [59.0, 26.0],
+    "Eswatini": [-26.5, 31.5],
+    "Ethiopia": [8.0, 38.0],
+    "Fiji": [-18.0, 175.0],
+    "Finland": [64.0, 26.0],
+    "France": [46.0, 2.0],
+    "Gabon": [-1.0, 11.75],
+    "Gambia": [13.5, -15.5],
+    "Georgia": [42.0, 43.5],
+    "Germany": [51.0, 9.0],
+    "Ghana": [8.0, -2.0],
+    "Greece": [39.0, 22.0],
+    "Grenada": [12.12, -61.67],
+    "Guatemala": [15.5, -90.25],
+    "Guinea": [11.0, -10.0],
+    "Guinea-Bissau": [12.0, -15.0],
+    "Guyana": [5.0, -59.0],
+    "Haiti": [19.0, -72.42],
+    "Honduras": [15.0, -86.5],
+    "Hong Kong": [22.3, 114.2],
+    "Hungary": [47.0, 20.0],
+    "Iceland": [65.0, -18.0],
+    "India": [20.0, 77.0],
+    "Indonesia": [-5.0, 120.0],
+    "Iran": [32.0, 53.0],
+    "Iraq": [33.0, 44.0],
+    "Ireland": [53.0, -8.0],
+    "Israel": [31.5, 34.75],
+    "Italy": [42.8, 12.8],
+    "Jamaica": [18.25, -77.5],
+    "Japan": [36.0, 138.0],
+    "Jordan": [31.0, 36.0],
+    "Kazakhstan": [48.0, 68.0],
+    "Kenya": [1.0, 38.0],
+    "Kiribati": [1.42, 173.0],
+    "Kosovo": [42.67, 21.17],
+    "Kuwait": [29.5, 45.75],
+    "Kyrgyzstan": [41.0, 75.0],
+    "Laos": [18.0, 105.0],
+    "Latvia": [57.0, 25.0],
+    "Lebanon": [33.8, 35.8],
+    "Lesotho": [-29.5, 28.5],
+    "Liberia": [6.5, -9.5],
+    "Libya": [25.0, 17.0],
+    "Liechtenstein": [47.17, 9.53],
+    "Lithuania": [56.0, 24.0],
+    "Luxembourg": [49.75, 6.17],
+    "Macao": [22.17, 113.55],
+    "Madagascar": [-20.0, 47.0],
+    "Malawi": [-13.5, 34.0],
+    "Malaysia": [2.5, 112.5],
+    "Maldives": [3.25, 73.0],
+    "Mali": [17.0, -4.0],
+    "Malta": [35.9, 14.4],
+    "Marshall Islands": [9.0, 168.0],
+    "Mauritania": [20.0, -12.0],
+    "Mauritius": [-20.3, 57.6],
+    "Mexico": [23.0, -102.0],
+    "Micronesia": [6.92, 158.25],
+    "Moldova": [47.0, 29.0],
+    "Monaco": [43.73, 7.42],
+    "Mongolia": [46.0, 105.0],
+    "Montenegro": [42.5, 19.3],
+    "Morocco": [32.0, -5.0],
+    "Mozambique": [-18.25, 35.0],
+    "Myanmar": [22.0, 98.0],
+    "Namibia": [-22.0, 17.0],
+    "Nauru": [-0.53, 166.92],
+    "Nepal": [28.0, 84.0],
+    "Netherlands": [52.5, 5.75],
+    "New Zealand": [-41.0, 174.0],
+    "Nicaragua": [13.0, -85.0],
+    "Niger": [16.0, 8.0],
+    "Nigeria": [10.0, 8.0],
+    "North Macedonia": [41.83, 22.0],
+    "Norway": [62.0, 10.0],
+    "Oman": [21.0, 57.0],
+    "Pakistan": [30.0, 70.0],
+    "Palau": [7.5, 134.5],
+    "Palestine": [32.0, 35.25],
+    "Panama": [9.0, -80.0],
+    "Papua New Guinea": [-6.0, 147.0],
+    "Paraguay": [-23.0, -58.0],
+    "Peru": [-10.0, -76.0],
+    "Philippines": [13.0, 122.0],
+    "Poland": [52.0, 20.0],
+    "Portugal": [39.5, -8.0],
+    "Qatar": [25.5, 51.25],
+    "Republic of Korea": [37.0, 127.5],
+    "Romania": [46.0, 25.0],
+    "Russian Federation": [60.0, 100.0],
+    "Rwanda": [-2.0, 30.0],
+    "Saint Kitts and Nevis": [17.33, -62.75],
+    "Saint Lucia": [14.0, -61.0],
+    "Saint Vincent and the Grenadines": [13.25, -61.2],
+    "Samoa": [-13.58, -172.33],
+    "San Marino": [43.77, 12.42],
+    "Sao Tome and Principe": [1.0, 7.0],
+    "Saudi Arabia": [25.0, 45.0],
+    "Senegal": [14.0, -14.0],
+    "Serbia": [44.0, 21.0],
+    "Seychelles": [-4.58, 55.67],
+    "Sierra Leone": [8.5, -11.5],
+    "Singapore": [1.3, 103.8],
+    "Slovakia": [48.7, 19.5],
+    "Slovenia": [46.1, 14.8],
+    "Solomon Islands": [-8.0, 159.0],
+    "Somalia": [10.0, 49.0],
+    "South Africa": [-29.0, 24.0],
+    "South Sudan": [7.0, 30.0],
+    "Spain": [40.0, -4.0],
+    "Sri Lanka": [7.0, 81.0],
+    "Sudan": [15.0, 30.0],
+    "Suriname": [4.0, -56.0],
+    "Sweden": [62.0, 15.0],
+    "Switzerland": [47.0, 8.0],
+    "Syria": [35.0, 38.0],
+    "Taiwan": [23.5, 121.0],
+    "Tajikistan": [39.0, 71.0],
+    "Tanzania": [-6.0, 35.0],
+    "Thailand": [15.0, 100.0],
+    "Timor-Leste": [-8.83, 125.92],
+    "Togo": [8.0, 1.17],
+    "Tonga": [-20.0, -175.0],
+    "Trinidad and Tobago": [11.0, -61.0],
+    "Tunisia": [34.0, 9.0],
+    "Turkey": [39.0, 35.0],
+    "Turkmenistan": [40.0, 60.0],
+    "Tuvalu": [-8.0, 178.0],
+    "Uganda": [1.0, 32.0],
+    "Ukraine": [49.0, 32.0],
+    "United Arab Emirates": [24.0, 54.0],
+    "United Kingdom": [54.0, -2.0],
+    "United States of America": [38.0, -97.0],
+    "Uruguay": [-33.0, -56.0],
+    "Uzbekistan": [41.0, 64.0],
+    "Vanuatu": [-16.0, 167.0],
+    "Venezuela": [8.0, -66.0],
+    "Vietnam": [16.0, 106.0],
+    "Yemen": [15.0, 48.0],
+    "Zambia": [-15.0, 30.0],
+    "Zimbabwe": [-20.0, 30.0],
+}
+
+COUNTRY_COORDS_JSON = json.dumps(COUNTRY_COORDS, separators=(',', ':'), ensure_ascii=False)
 
 if __name__ == '__main__':
     print("Processing DPI payment systems data...")